@@ -1,7 +1,7 @@
-import pulp
+import argparse
+import operator
 
-# Define the model
-model = pulp.LpProblem("Sheep_Nutrition_Optimization", pulp.LpMinimize)
+import pulp
 
 # Nutritional requirements for different stages (only for sheep weighing 154 lbs)
 sheep_nutrition_data = {
@@ -17,65 +17,43 @@ sheep_nutrition_data = {
 # Hardcoded flushing stage
 current_nutrition_stage = "Last_4_Weeks_Gestation"
 
-# Set nutritional requirements based on the hardcoded stage
-nutrition = sheep_nutrition_data[current_nutrition_stage]
-protein_requirement_pct = nutrition["protein_pct"]
-tdn_requirement_pct = nutrition["tdn_pct"]
-daily_dmi_limit = nutrition["dm_intake"]
-
-print(f"Using {current_nutrition_stage} stage for sheep weighing 154 lbs:")
-print(f"  DM Intake: {daily_dmi_limit} lbs/day")
-print(f"  TDN Requirement: {tdn_requirement_pct}%")
-print(f"  Protein Requirement: {protein_requirement_pct}%")
-
 # Forage characteristics by maturity stage
 forage_quality = {
     "Early_vegetative": {"protein": 18, "fiber": 24, "tdn": 60, "dm": 25},  # High moisture (75% water)
-    "Late_vegetative": {"protein": 15, "fiber": 25, "tdn": 58, "dm": 30}, 
+    "Late_vegetative": {"protein": 15, "fiber": 25, "tdn": 58, "dm": 30},
     "Early_flowering": {"protein": 15, "fiber": 26, "tdn": 56, "dm": 35},
     "Late_flowering": {"protein": 10, "fiber": 29, "tdn": 50, "dm": 45},
     "Mature": {"protein": 6, "fiber": 33, "tdn": 40, "dm": 75},
-    "Dry": {"protein": 5, "fiber": 34, "tdn": 34, "dm": 90},   
+    "Dry": {"protein": 5, "fiber": 34, "tdn": 34, "dm": 90},
     "Dry_leached": {"protein": 3, "fiber": 35, "tdn": 30, "dm": 92}
 }
 
 # Hardcoded forage stage
-current_forage_stage = "Dry" 
-
-# Set forage characteristics based on selected stage
-forage = forage_quality[current_forage_stage]
-forage_protein_pct = forage["protein"]
-forage_tdn_pct = forage["tdn"]
-forage_dm_pct = forage["dm"]  
-
-print(f"Using forage at {current_forage_stage} stage: {forage_protein_pct}% protein, {forage_tdn_pct}% TDN, {forage_dm_pct}% DM")
+current_forage_stage = "Dry"
 
 # Dry matter availability per acre (lbs)
 available_forage_per_acre = 2000  # lbs/acre available forage
 sheep_per_acre = 90  # Stocking rate (sheep per acre)
 
-# Correctly compute maximum forage intake per sheep (dry matter basis)
-max_forage_per_sheep = min(daily_dmi_limit, (available_forage_per_acre * forage_dm_pct / 100) / sheep_per_acre)
-min_forage_per_sheep = daily_dmi_limit * 0.5 if daily_dmi_limit * 0.5 <= max_forage_per_sheep else max_forage_per_sheep  # Minimum forage intake (75% of max)
-
-# Add forage intake as a decision variable
-forage_intake = pulp.LpVariable("forage_intake", lowBound=min_forage_per_sheep, upBound=max_forage_per_sheep)
-
-# Calculate max intake for Purina Accuration Range Pellet based on 1/3 protein rule
-total_protein_required_lbs = (protein_requirement_pct/100) * daily_dmi_limit  # 9.19% of 4.0 lbs
-max_protein_from_supplement_lbs = total_protein_required_lbs / 3  # 1/3 of total protein
-range_pellet_protein_pct = 33  # protein percentage in the supplement
-max_range_pellet_intake = max_protein_from_supplement_lbs / (range_pellet_protein_pct/100)
+# Solver shared by every solve, picked once at import: in-process HiGHS when highspy is
+# installed (no LP file or subprocess), then a highs executable on PATH, otherwise the
+# bundled CBC binary
+if pulp.HiGHS().available():
+    _solver = pulp.HiGHS(msg=False)
+elif pulp.HiGHS_CMD().available():
+    _solver = pulp.HiGHS_CMD(msg=False)
+else:
+    _solver = pulp.PULP_CBC_CMD(msg=False, keepFiles=False, mip=False, threads=1, presolve=True)
 
-# Update the supplements dictionary with calculated maximum intake
-supplements = {
+# Supplement catalog, defined once at import and shared by every solve
+supplement_catalog = {
     # Feed mill supplements
     "Corn": {"cost": 0.25, "protein": 9, "tdn": 90, "dm": 88, "min_intake": 0, "max_intake": 3.0, "is_block": False},
     "Soybean_Meal": {"cost": 0.30, "protein": 44, "tdn": 80, "dm": 89, "min_intake": 0, "max_intake": 2.0, "is_block": False},
     "Wheat_Middlings": {"cost": 0.13, "protein": 16, "tdn": 77, "dm": 89, "min_intake": 0, "max_intake": 2.5, "is_block": False},
     "Molasses": {"cost": 0.20, "protein": 4, "tdn": 75, "dm": 75, "min_intake": 0.05, "max_intake": 0.5, "is_block": False},
     "Limestone": {"cost": 0.05, "protein": 0, "tdn": 0, "dm": 99, "min_intake": 0, "max_intake": 0.1, "is_block": False},
-    
+
     # Feed store supplements
     "Purina_Accuration": {"cost": 129.99 / 200, "protein": 25, "tdn": 85, "dm": 90, "min_intake": 0, "max_intake": 1.0, "is_block": True},
     "Cascade_Pellets": {"cost": 11.49 / 50, "protein": 14.5, "tdn": 68, "dm": 90, "min_intake": 0, "max_intake": 2.0, "is_block": False},
@@ -84,122 +62,347 @@ supplements = {
     "Rangeland_Tub_Wilco": {"cost": 104.99 / 125, "protein": 23, "tdn": 85, "dm": 96, "min_intake": 0, "max_intake": 1.0, "is_block": True},
     "Accuration_Block_Wilco": {"cost": 149.99 / 200, "protein": 25, "tdn": 85, "dm": 96, "min_intake": 0, "max_intake": 1.0, "is_block": True},
     "Rangeland_Allstock_Tub": {"cost": 99.99 / 125, "protein": 15, "tdn": 85, "dm": 96, "min_intake": 0, "max_intake": 1.0, "is_block": True},
-    
-    # Range pellet with dynamically calculated max intake
-    "Purina_Accuration_Range_Pellet": {"cost": 14.50 / 50, "protein": 33, "tdn": 85, "dm": 90, "min_intake": 0, "max_intake": max_range_pellet_intake, "is_block": True},
+
+    # Range pellet max intake depends on the stage protein requirement (set in build_and_solve)
+    "Purina_Accuration_Range_Pellet": {"cost": 14.50 / 50, "protein": 33, "tdn": 85, "dm": 90, "min_intake": 0, "max_intake": None, "is_block": True},
 }
 
-# Define decision variables (amount of each feed consumed per day per sheep)
-supplement_intake = {feed: pulp.LpVariable(f"intake_{feed}", lowBound=supplements[feed]["min_intake"], 
-                                         upBound=supplements[feed]["max_intake"])
-                   for feed in supplements}
+# Nutrient contents as fractions of intake
+supplement_protein_fracs = {feed: s["protein"] / 100 for feed, s in supplement_catalog.items()}
+supplement_tdn_fracs = {feed: s["tdn"] / 100 for feed, s in supplement_catalog.items()}
+forage_protein_fracs = {stage: f["protein"] / 100 for stage, f in forage_quality.items()}
+forage_tdn_fracs = {stage: f["tdn"] / 100 for stage, f in forage_quality.items()}
+forage_dm_fracs = {stage: f["dm"] / 100 for stage, f in forage_quality.items()}
+
+
+def build_and_solve(nutrition_stage: str, forage_stage: str) -> dict:
+    """Build and solve the least-cost supplement LP for one nutrition/forage stage pair."""
+    # Set nutritional requirements based on the selected stage
+    nutrition = sheep_nutrition_data[nutrition_stage]
+    protein_requirement_pct = nutrition["protein_pct"]
+    tdn_requirement_pct = nutrition["tdn_pct"]
+    daily_dmi_limit = nutrition["dm_intake"]
+
+    # Set forage characteristics based on selected stage
+    forage_dm_pct = forage_quality[forage_stage]["dm"]
+
+    # Correctly compute maximum forage intake per sheep (dry matter basis)
+    max_forage_per_sheep = min(daily_dmi_limit, (available_forage_per_acre * forage_dm_pct / 100) / sheep_per_acre)
+    min_forage_per_sheep = min(daily_dmi_limit * 0.5, max_forage_per_sheep)  # Minimum forage intake (50% of DMI, capped at max)
+
+    # Calculate max intake for Purina Accuration Range Pellet based on 1/3 protein rule
+    total_protein_required_lbs = (protein_requirement_pct/100) * daily_dmi_limit  # 9.19% of 4.0 lbs
+    max_protein_from_supplement_lbs = total_protein_required_lbs / 3  # 1/3 of total protein
+    range_pellet_protein_pct = 33  # protein percentage in the supplement
+    max_range_pellet_intake = max_protein_from_supplement_lbs / (range_pellet_protein_pct/100)
 
-# Create binary variables for protein blocks (1 if used, 0 if not)
-block_used = {feed: pulp.LpVariable(f"use_{feed}", cat='Binary') 
-             for feed in supplements if supplements[feed]["is_block"]}
+    # Copy the catalog with the range pellet's calculated maximum intake filled in
+    range_pellet = "Purina_Accuration_Range_Pellet"
+    supplements = {**supplement_catalog, range_pellet: {**supplement_catalog[range_pellet], "max_intake": max_range_pellet_intake}}
 
-# Link block usage to intake (if block_used=0, then intake must be 0)
-for feed in block_used:
-    model += supplement_intake[feed] <= supplements[feed]["max_intake"] * block_used[feed], f"Link_{feed}"
+    # A feed with no protein or TDN (e.g. Limestone) only fills intake. While forage
+    # can take up all intake beyond the mandatory minimums, swapping it for forage is
+    # free and never lowers nutrition, so it is never in a least-cost plan: leave it
+    # out of the LP and report it as 0
+    forage_can_fill = max_forage_per_sheep >= daily_dmi_limit - sum(s["min_intake"] for s in supplements.values())
+    filler_feeds = {feed for feed, s in supplements.items()
+                    if forage_can_fill and s["protein"] == 0 and s["tdn"] == 0
+                    and s["min_intake"] == 0}
 
-# Add constraint: At most one protein block can be used
-model += pulp.lpSum(block_used[feed] for feed in block_used) <= 1, "One_Block_Only"
+    # Only one block is ever fed, so a block that is no cheaper, no richer in protein or
+    # TDN and no less available than another one can always be swapped for it at no
+    # extra cost. Such blocks (of identical ones, all but the first) are left out of the
+    # LP too, along with any feed that may not be fed at all
+    def block_beats(a, b):
+        return (a["cost"] <= b["cost"] and a["protein"] >= b["protein"] and a["tdn"] >= b["tdn"]
+                and a["min_intake"] <= b["min_intake"] and a["max_intake"] >= b["max_intake"])
 
-# Objective function: Minimize total cost of supplementation
-model += pulp.lpSum(supplements[feed]["cost"] * supplement_intake[feed] for feed in supplements), "Total_Cost"
+    blocks = [feed for feed in supplements if supplements[feed]["is_block"]]
+    dominated_blocks = {feed for i, feed in enumerate(blocks)
+                        if supplements[feed]["min_intake"] == 0
+                        and any(block_beats(supplements[other], supplements[feed])
+                                and (j < i or not block_beats(supplements[feed], supplements[other]))
+                                for j, other in enumerate(blocks) if j != i)}
+    unused_feeds = {feed for feed, s in supplements.items() if s["max_intake"] == 0}
 
-# Calculate forage nutrient contributions
-forage_protein_lbs = forage_intake * forage_protein_pct / 100
-forage_tdn_lbs = forage_intake * forage_tdn_pct / 100
-forage_dm_lbs = forage_intake
+    # Column-wise copy of the supplement table, in the order of `names`
+    excluded = filler_feeds | dominated_blocks | unused_feeds
+    names = [feed for feed in supplements if feed not in excluded]
+    costs = [supplements[feed]["cost"] for feed in names]
+    protein_fracs = [supplement_protein_fracs[feed] for feed in names]
+    tdn_fracs = [supplement_tdn_fracs[feed] for feed in names]
+    min_intakes = [supplements[feed]["min_intake"] for feed in names]
+    max_intakes = [supplements[feed]["max_intake"] for feed in names]
+    is_block = [supplements[feed]["is_block"] for feed in names]
 
-# Calculate required nutrients based on exactly daily_dmi_limit pounds of feed
-protein_req_lbs = (protein_requirement_pct / 100) * daily_dmi_limit
-tdn_req_lbs = (tdn_requirement_pct / 100) * daily_dmi_limit
+    # Forage nutrient contributions per lb of forage intake
+    forage_protein_coef = forage_protein_fracs[forage_stage]
+    forage_tdn_coef = forage_tdn_fracs[forage_stage]
 
-# Define a variable for total feed intake
-total_feed = forage_intake + pulp.lpSum(supplement_intake[feed] for feed in supplements)
+    # Calculate required nutrients based on exactly daily_dmi_limit pounds of feed
+    protein_req_lbs = (protein_requirement_pct / 100) * daily_dmi_limit
+    tdn_req_lbs = (tdn_requirement_pct / 100) * daily_dmi_limit
 
-# Constraint: Ensure Total DMI equals exactly the requirement
-# This makes percentage calculations work correctly
-model += total_feed == daily_dmi_limit, "Exact_DMI"
+    # If every supplement at its minimum intake, topped up with forage to the DMI target,
+    # meets all requirements and feeds at most one block, that plan is optimal
+    base_forage = daily_dmi_limit - sum(min_intakes)
+    if (all(cost >= 0 for cost in costs)
+            and sum(1 for lo, block in zip(min_intakes, is_block) if block and lo > 0) <= 1
+            and min_forage_per_sheep <= base_forage <= max_forage_per_sheep
+            and sum(map(operator.mul, min_intakes, protein_fracs)) + base_forage * forage_protein_coef >= protein_req_lbs
+            and sum(map(operator.mul, min_intakes, tdn_fracs)) + base_forage * forage_tdn_coef >= tdn_req_lbs):
+        return {
+            "nutrition_stage": nutrition_stage,
+            "forage_stage": forage_stage,
+            "status": pulp.LpStatusOptimal,
+            "supplements": supplements,
+            "forage_intake": base_forage,
+            "intakes": {feed: supplements[feed]["min_intake"] for feed in supplements},
+            "daily_cost": sum(map(operator.mul, min_intakes, costs)),
+        }
 
-# Constraints: Ensure nutritional needs are met (in pounds)
-model += pulp.lpSum(supplements[feed]["protein"] / 100 * supplement_intake[feed] for feed in supplements) + forage_protein_lbs >= protein_req_lbs, "Protein_Requirement"
-model += pulp.lpSum(supplements[feed]["tdn"] / 100 * supplement_intake[feed] for feed in supplements) + forage_tdn_lbs >= tdn_req_lbs, "TDN_Requirement"
+    # Define the model
+    model = pulp.LpProblem("Sheep_Nutrition_Optimization", pulp.LpMinimize)
 
-# Dry Matter Content constraint (adjust for DM content of feeds)
-# This is needed because not all feeds are 100% dry matter
-model += pulp.lpSum((supplements[feed]["dm"] / 100) * supplement_intake[feed] for feed in supplements) + forage_dm_lbs * (forage_dm_pct / 100) <= daily_dmi_limit, "DMI_Limit"
+    # Define decision variables (amount of each feed consumed per day per sheep)
+    supplement_intake = [pulp.LpVariable(f"intake_{feed}", lowBound=lo, upBound=hi)
+                         for feed, lo, hi in zip(names, min_intakes, max_intakes)]
 
-# Add explicit solver to fix NoneType error
-solver = pulp.PULP_CBC_CMD()
-model.solve(solver)
+    # Objective function: Minimize total cost of supplementation
+    model.setObjective(pulp.LpAffineExpression(zip(supplement_intake, costs)))
+
+    # Total DMI equals the requirement exactly, so forage = daily_dmi_limit - sum(supplements);
+    # each coefficient below is net of the forage a feed displaces
+    total_supplement_terms = [(var, 1) for var in supplement_intake]
+
+    # Forage intake limits, as limits on the total supplement (each row needs its own
+    # expression, since a constraint's name is stored on its expression)
+    model.addConstraint(pulp.LpConstraint(pulp.LpAffineExpression(total_supplement_terms), pulp.LpConstraintLE,
+                                          rhs=daily_dmi_limit - min_forage_per_sheep), "Forage_Min")
+    model.addConstraint(pulp.LpConstraint(pulp.LpAffineExpression(total_supplement_terms), pulp.LpConstraintGE,
+                                          rhs=daily_dmi_limit - max_forage_per_sheep), "Forage_Max")
+
+    # Collect the protein and TDN terms in a single pass over the feeds
+    protein_terms, tdn_terms = [], []
+    for var, protein_frac, tdn_frac in zip(supplement_intake, protein_fracs, tdn_fracs):
+        protein_terms.append((var, protein_frac - forage_protein_coef))
+        tdn_terms.append((var, tdn_frac - forage_tdn_coef))
+
+    # Constraints: Ensure nutritional needs are met (in pounds)
+    model.addConstraint(pulp.LpConstraint(pulp.LpAffineExpression(protein_terms), pulp.LpConstraintGE,
+                                          rhs=protein_req_lbs - forage_protein_coef * daily_dmi_limit),
+                        "Protein_Requirement")
+    model.addConstraint(pulp.LpConstraint(pulp.LpAffineExpression(tdn_terms), pulp.LpConstraintGE,
+                                          rhs=tdn_req_lbs - forage_tdn_coef * daily_dmi_limit),
+                        "TDN_Requirement")
+
+    # Only one protein block can be fed: solve a plain LP for each choice (no block, or
+    # exactly one) and keep the cheapest
+    block_feeds = [i for i in range(len(names)) if is_block[i]]
+
+    def use_block(chosen):
+        for i in block_feeds:
+            supplement_intake[i].upBound = max_intakes[i] if i == chosen else 0
+
+    # Keep a snapshot of the cheapest plan solved so far
+    best = None
+    for chosen in [None] + block_feeds:
+        use_block(chosen)
+        model.solve(_solver)
+        if model.status != pulp.LpStatusOptimal:
+            continue
+        daily_cost = pulp.value(model.objective)
+        if best is None or daily_cost < best["daily_cost"]:
+            # PuLP leaves .value() as None for variables the solver did not report
+            solved = {feed: var.value() or 0.0 for feed, var in zip(names, supplement_intake)}
+            best = {
+                "forage_intake": daily_dmi_limit - sum(solved.values()),
+                "intakes": {feed: solved.get(feed, 0.0) for feed in supplements},
+                "daily_cost": daily_cost,
+            }
+
+    result = {
+        "nutrition_stage": nutrition_stage,
+        "forage_stage": forage_stage,
+        "status": model.status if best is None else pulp.LpStatusOptimal,
+        "supplements": supplements,
+    }
+    if best is not None:
+        result.update(best)
+    return result
+
+
+def analyze_plan(result: dict) -> dict:
+    """Compute nutrition, pasture duration and cost totals for a solved (optimal) stage pair."""
+    forage_stage = result["forage_stage"]
+    forage_value = result["forage_intake"]
+    intakes = result["intakes"]
+
+    # Total feed consumption
+    total_supplement = sum(intakes.values())
+    total_feed_val = forage_value + total_supplement
+
+    # Actual nutrition provided
+    actual_protein = forage_value * forage_protein_fracs[forage_stage] + sum(
+        value * supplement_protein_fracs[feed] for feed, value in intakes.items())
+    actual_tdn = forage_value * forage_tdn_fracs[forage_stage] + sum(
+        value * supplement_tdn_fracs[feed] for feed, value in intakes.items())
+
+    # Calculate pasture duration
+    daily_forage_all_sheep = forage_value * sheep_per_acre  # lbs/day for all sheep
+    total_available_forage = available_forage_per_acre * forage_dm_fracs[forage_stage]  # lbs of DM available on the entire pasture
+    days_on_pasture = total_available_forage / daily_forage_all_sheep if daily_forage_all_sheep > 0 else float('inf')
+
+    # Sheep-days on the pasture: scales any per-sheep daily amount to the whole grazing period
+    sheep_days = sheep_per_acre * days_on_pasture
+
+    return {
+        "total_supplement": total_supplement,
+        "total_feed": total_feed_val,
+        "actual_protein": actual_protein,
+        "actual_tdn": actual_tdn,
+        "daily_forage_all_sheep": daily_forage_all_sheep,
+        "total_available_forage": total_available_forage,
+        "days_on_pasture": days_on_pasture,
+        "sheep_days": sheep_days,
+        "total_supplement_needed": total_supplement * sheep_days,
+        "total_grazing_cost": result["daily_cost"] * sheep_days,
+    }
+
+
+def print_report(result: dict) -> None:
+    """Print the feed plan, nutrition, pasture and cost breakdown for a solved stage pair."""
+    current_nutrition_stage = result["nutrition_stage"]
+    current_forage_stage = result["forage_stage"]
+
+    nutrition = sheep_nutrition_data[current_nutrition_stage]
+    protein_requirement_pct = nutrition["protein_pct"]
+    tdn_requirement_pct = nutrition["tdn_pct"]
+    daily_dmi_limit = nutrition["dm_intake"]
+    protein_req_lbs = protein_requirement_pct/100 * daily_dmi_limit
+    tdn_req_lbs = tdn_requirement_pct/100 * daily_dmi_limit
+
+    print(f"Using {current_nutrition_stage} stage for sheep weighing 154 lbs:")
+    print(f"  DM Intake: {daily_dmi_limit} lbs/day")
+    print(f"  TDN Requirement: {tdn_requirement_pct}%")
+    print(f"  Protein Requirement: {protein_requirement_pct}%")
+
+    forage = forage_quality[current_forage_stage]
+    forage_protein_pct = forage["protein"]
+    forage_tdn_pct = forage["tdn"]
+    forage_dm_pct = forage["dm"]
+
+    print(f"Using forage at {current_forage_stage} stage: {forage_protein_pct}% protein, {forage_tdn_pct}% TDN, {forage_dm_pct}% DM")
+
+    # Display results
+    print(f"Status: {pulp.LpStatus[result['status']]}")
+    if result["status"] != pulp.LpStatusOptimal:
+        print("The model is infeasible. Please check your constraints and inputs.")
+        return
+
+    supplements = result["supplements"]
+    forage_value = result["forage_intake"]
+    intakes = result["intakes"]
+    analysis = analyze_plan(result)
 
-# Display results
-print(f"Status: {pulp.LpStatus[model.status]}")
-if model.status == pulp.LpStatusOptimal:
     # Daily intake per sheep
     print(f"\nOptimal Feed Plan ({current_nutrition_stage} Stage, Forage: {current_forage_stage}):")
-    print(f"  Forage intake: {forage_intake.value():.2f} lbs/day")
-    for feed in supplements:
-        print(f"  {feed}: {supplement_intake[feed].value():.2f} lbs/day")
-    
+    print(f"  Forage intake: {forage_value:.2f} lbs/day")
+    for feed, value in intakes.items():
+        print(f"  {feed}: {value:.2f} lbs/day")
+
     # Total feed consumption
-    total_supplement = sum(supplement_intake[feed].value() for feed in supplements)
-    total_feed = forage_intake.value() + total_supplement
-    print(f"\nTotal feed consumption: {total_feed:.2f} lbs/sheep/day")
+    total_supplement = analysis["total_supplement"]
+    total_feed_val = analysis["total_feed"]
+    print(f"\nTotal feed consumption: {total_feed_val:.2f} lbs/sheep/day")
     print(f"Total supplement: {total_supplement:.2f} lbs/sheep/day")
     print(f"DMI requirement: {daily_dmi_limit:.2f} lbs/sheep/day")
-    
+
     # Actual nutrition provided
-    actual_protein = forage_intake.value() * forage_protein_pct/100 + sum(supplement_intake[feed].value() * supplements[feed]["protein"]/100 for feed in supplements)
-    actual_tdn = forage_intake.value() * forage_tdn_pct/100 + sum(supplement_intake[feed].value() * supplements[feed]["tdn"]/100 for feed in supplements)
-    
+    actual_protein = analysis["actual_protein"]
+    actual_tdn = analysis["actual_tdn"]
+
     print(f"\nNutritional Analysis ({current_nutrition_stage} Stage):")
-    print(f"  Protein: {actual_protein:.2f} lbs ({actual_protein/total_feed*100:.2f}%)")
-    print(f"  Required protein: {protein_requirement_pct/100*daily_dmi_limit:.2f} lbs ({protein_requirement_pct:.2f}%)")
-    print(f"  TDN: {actual_tdn:.2f} lbs ({actual_tdn/total_feed*100:.2f}%)")
-    print(f"  Required TDN: {tdn_requirement_pct/100*daily_dmi_limit:.2f} lbs ({tdn_requirement_pct:.2f}%)")
-    
-    # Calculate pasture duration
-    daily_forage_all_sheep = forage_intake.value() * sheep_per_acre  # lbs/day for all sheep
-    total_available_forage = available_forage_per_acre * forage_dm_pct/100  # lbs of DM available on the entire pasture
-    days_on_pasture = total_available_forage / daily_forage_all_sheep if daily_forage_all_sheep > 0 else float('inf')
-    
-    # Calculate supplemental feed quantities
+    print(f"  Protein: {actual_protein:.2f} lbs ({actual_protein/total_feed_val*100:.2f}%)")
+    print(f"  Required protein: {protein_req_lbs:.2f} lbs ({protein_requirement_pct:.2f}%)")
+    print(f"  TDN: {actual_tdn:.2f} lbs ({actual_tdn/total_feed_val*100:.2f}%)")
+    print(f"  Required TDN: {tdn_req_lbs:.2f} lbs ({tdn_requirement_pct:.2f}%)")
+
+    # Pasture duration and supplemental feed quantities
+    daily_forage_all_sheep = analysis["daily_forage_all_sheep"]
+    total_available_forage = analysis["total_available_forage"]
+    days_on_pasture = analysis["days_on_pasture"]
+    sheep_days = analysis["sheep_days"]
     daily_supplement_all_sheep = total_supplement * sheep_per_acre
-    total_supplement_needed = daily_supplement_all_sheep * days_on_pasture
-    
+    total_supplement_needed = analysis["total_supplement_needed"]
+
     print(f"\nSupplemental Feed Requirements ({current_forage_stage} Forage):")
     print(f"  Daily supplement per sheep: {total_supplement:.2f} lbs/day")
     print(f"  Daily supplement for all {sheep_per_acre} sheep: {daily_supplement_all_sheep:.2f} lbs/day")
     print(f"  Total supplement needed for {days_on_pasture:.1f} days: {total_supplement_needed:.2f} lbs")
-    
+
     # Print detailed supplement requirements
     print("\nDetailed Supplement Requirements:")
-    for feed in supplements:
-        if supplement_intake[feed].value() > 0.001:  # Only show feeds that are actually used
-            daily_amount = supplement_intake[feed].value() * sheep_per_acre
-            total_amount = daily_amount * days_on_pasture
+    for feed, value in intakes.items():
+        if value > 0.001:  # Only show feeds that are actually used
+            daily_amount = value * sheep_per_acre
+            total_amount = value * sheep_days
             feed_cost = supplements[feed]["cost"] * total_amount
             print(f"  {feed}: {daily_amount:.2f} lbs/day, {total_amount:.2f} lbs total (${feed_cost:.2f})")
-    
+
     print(f"\nPasture Duration Analysis ({current_forage_stage} Forage):")
     print(f"  Sheep per acre: {sheep_per_acre}")
     print(f"  Total forage available: {total_available_forage:.2f} lbs DM")
     print(f"  Daily forage consumption (all sheep): {daily_forage_all_sheep:.2f} lbs DM/day")
     print(f"  Days pasture will last: {days_on_pasture:.1f} days")
-    
+
     # Cost analysis
-    daily_cost_per_sheep = pulp.value(model.objective)
+    daily_cost_per_sheep = result["daily_cost"]
     daily_cost_all_sheep = daily_cost_per_sheep * sheep_per_acre
-    total_grazing_cost = daily_cost_all_sheep * days_on_pasture
-    
+    total_grazing_cost = analysis["total_grazing_cost"]
+
     print(f"\nFeed Cost Analysis ({current_nutrition_stage} Stage, Forage: {current_forage_stage}):")
     print(f"  Feed Cost per sheep per day: ${daily_cost_per_sheep:.2f}")
     print(f"  Feed Cost for all {sheep_per_acre} sheep per day: ${daily_cost_all_sheep:.2f}")
     print(f"  Total feed costs for {days_on_pasture:.1f} days of grazing: ${total_grazing_cost:.2f}")
-else:
-    print("The model is infeasible. Please check your constraints and inputs.")
 
+
+def solve_forage_sweep(nutrition_stage: str) -> dict:
+    """Solve one nutrition stage against every forage maturity stage, keyed by forage stage."""
+    return {forage_stage: build_and_solve(nutrition_stage, forage_stage) for forage_stage in forage_quality}
+
+
+def print_sweep_summary(results: dict) -> None:
+    """Print one line per forage stage with the daily cost, supplement and pasture duration."""
+    print(f"\nForage Stage Sweep ({next(iter(results.values()))['nutrition_stage']} Stage):")
+    for forage_stage, result in results.items():
+        if result["status"] != pulp.LpStatusOptimal:
+            print(f"  {forage_stage}: {pulp.LpStatus[result['status']]}")
+            continue
+        analysis = analyze_plan(result)
+        print(f"  {forage_stage}: ${result['daily_cost']:.2f}/sheep/day, "
+              f"{analysis['total_supplement']:.2f} lbs supplement/sheep/day, "
+              f"{analysis['days_on_pasture']:.1f} days, ${analysis['total_grazing_cost']:.2f} total")
+
+
+def main(argv=None) -> None:
+    """Command-line entry point: report one stage pair, optionally with a forage stage sweep."""
+    parser = argparse.ArgumentParser(description="Optimize sheep supplement costs on pasture.")
+    parser.add_argument("--stage", choices=list(sheep_nutrition_data), default=current_nutrition_stage,
+                        help=f"nutrition stage (default: {current_nutrition_stage})")
+    parser.add_argument("--forage", choices=list(forage_quality), default=current_forage_stage,
+                        help=f"forage maturity stage to report in full (default: {current_forage_stage})")
+    parser.add_argument("--sweep", action=argparse.BooleanOptionalAction, default=True,
+                        help="also solve every forage stage and print a summary")
+    args = parser.parse_args(argv)
+
+    if not args.sweep:
+        print_report(build_and_solve(args.stage, args.forage))
+        return
+    sweep = solve_forage_sweep(args.stage)
+    print_report(sweep[args.forage])
+    print_sweep_summary(sweep)
+
+
+if __name__ == "__main__":
+    main()